@@ -4,18 +4,106 @@ Comprehensive Playwright Test Suite for Passio Tour Application
 Tests all major pages and flows as specified in requirements
 """
 
-from playwright.sync_api import sync_playwright, expect
-import json
+from playwright.async_api import async_playwright, expect, TimeoutError as PlaywrightTimeoutError
+import asyncio
+import collections
+import html
+import itertools
+import orjson
+import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
+STATUS_ICONS = {'PASSED': "✅", 'FAILED': "❌"}
+
+LOGIN_EMAIL = "admin@passiotour.com"
+LOGIN_PASSWORD = "Admin@123"
+
+# Login form fallbacks, each resolved in a single query
+EMAIL_SELECTOR = ('input[type="email"], input[name="email"], '
+                  'input[placeholder*="email" i], input[id*="email" i]')
+PASSWORD_SELECTOR = ('input[type="password"], input[name="password"], '
+                     'input[placeholder*="password" i], input[id*="password" i]')
+SIGN_IN_SELECTOR = ('button:has-text("Sign In"), button[type="submit"], '
+                    'button:has-text("Login"), input[type="submit"]')
+
+# Collects page title, URL, body size and error/404 markers in a single round-trip
+_PAGE_PROBE_JS = """() => {
+    const text = document.body ? document.body.innerText : '';
+    return {
+        title: document.title,
+        url: location.href,
+        body_len: text.length,
+        is_404: /404|not found/i.test(text),
+        has_error: /error|404|not found|something went wrong/i.test(text)
+    };
+}"""
+
+# React only attaches its props to DOM nodes once the client has hydrated them
+_HYDRATED_JS = """selector => {
+    const el = document.querySelector(selector);
+    return !!el && Object.keys(el).some(k => k.startsWith('__reactProps$'));
+}"""
+
+# True once useAuth has settled: either the dashboard greeting rendered or we were sent to login
+_DASHBOARD_SETTLED_JS = """() => location.pathname.startsWith('/login') ||
+    [...document.querySelectorAll('main h2')].some(h => h.textContent.includes('Welcome back'))"""
+
+# Tour list after useTours settles: loaded list heading, ErrorState or the empty state
+TOURS_SETTLED_SELECTOR = ('main h2:has-text("Tours ("), main :text("Something went wrong"), '
+                          'main :text("No tours found")')
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+# Image, font and media URLs (incl. the Next.js image optimizer) skipped by status-only
+# tests; matched by URL so scripts and documents never round-trip through Python
+_HEAVY_RESOURCE_RE = re.compile(
+    r'\.(png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|eot|mp4|webm|mp3|ogg|wav)(\?|$)'
+    r'|/_next/image\?',
+    re.IGNORECASE
+)
+
+
+async def _abort_route(route):
+    """Abort a routed request"""
+    await route.abort()
+
+
+def _write_png(path, png):
+    """Write encoded screenshot bytes to disk"""
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(png)
+
+
 class PassioTourTester:
     def __init__(self):
         self.base_url = "http://localhost:3000"
         self.screenshot_dir = "/home/nev3r/projects/passio-tour/.playwright-mcp"
+        self.report_path = f"{self.screenshot_dir}/test_report.json"
+        # Results are streamed to NDJSON as they are logged so a crashed run keeps them
+        self.results_log_path = f"{self.report_path}.ndjson"
+        self._results_log = None  # opened for the duration of run_all_tests
         self.test_results = []
-        self.screenshots_taken = []
-        self.console_errors = []
+        d = self.screenshot_dir
+        self.paths = {
+            'homepage': f"{d}/test_01_homepage.png",
+            'login_page': f"{d}/test_02_login_page.png",
+            'login_filled': f"{d}/test_03_login_filled.png",
+            'after_login': f"{d}/test_04_after_login.png",
+            'static_about': f"{d}/test_07_static_about.png",
+            'static_contact': f"{d}/test_07_static_contact.png",
+            'static_faq': f"{d}/test_07_static_faq.png",
+            'register': f"{d}/test_08_register.png",
+        }
+        self.screenshots_taken = set()
+        # Bounded so chatty pages cannot grow the error log without limit
+        self.console_errors = collections.deque(maxlen=500)
+        self._console_dropped = 0
+        # Screenshot files are written in the background during run_all_tests
+        self._io_pool = None
+        self._io_futures = []  # (path, future) pairs
 
     def log_test(self, test_name, status, details, screenshot_path=None):
         """Log test result"""
@@ -27,35 +115,80 @@ class PassioTourTester:
             "screenshot": screenshot_path
         }
         self.test_results.append(result)
+        if self._results_log is not None:
+            self._results_log.write(orjson.dumps(result) + b'\n')
+            # Flush every record so results survive the process being killed
+            self._results_log.flush()
         print(f"\n{'='*60}")
         print(f"TEST: {test_name}")
         print(f"STATUS: {status}")
         print(f"DETAILS: {details}")
         if screenshot_path:
             print(f"SCREENSHOT: {screenshot_path}")
-            self.screenshots_taken.append(screenshot_path)
+            self.screenshots_taken.add(screenshot_path)
         print('='*60)
 
+    async def _shot(self, page, path, full=False):
+        """Capture a screenshot (viewport unless full) and queue the file write on the I/O pool"""
+        png = await page.screenshot(full_page=full)
+        if self._io_pool is None:
+            # Outside a run there is no pool, so write inline
+            _write_png(path, png)
+            return
+        future = self._io_pool.submit(_write_png, path, png)
+        self._io_futures.append((path, future))
+
+    def check_screenshot_writes(self):
+        """Wait for queued screenshot writes and report any that failed"""
+        wait([future for _, future in self._io_futures])
+        for path, future in self._io_futures:
+            error = future.exception()
+            if error is not None:
+                self.screenshots_taken.discard(path)
+                self.log_test("Screenshot Write", "FAILED",
+                             f"Could not write {path}: {str(error)}")
+
+    async def wait_for_element(self, page, selector, timeout=5000):
+        """Wait for the first element matching selector to be visible; False on timeout"""
+        try:
+            await page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def wait_for_hydration(self, page, selector, timeout=10000):
+        """Wait until React has hydrated the element matching selector; False on timeout"""
+        try:
+            await page.wait_for_function(_HYDRATED_JS, arg=selector, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
     def setup_console_listener(self, page):
         """Setup console error listener"""
-        def handle_console(msg):
-            if msg.type in ['error', 'warning']:
-                error_msg = f"[{msg.type.upper()}] {msg.text}"
+        def handle_console(msg_type, text):
+            if msg_type in ['error', 'warning']:
+                error_msg = f"[{msg_type.upper()}] {text}"
+                if len(self.console_errors) == self.console_errors.maxlen:
+                    self._console_dropped += 1
                 self.console_errors.append(error_msg)
-                print(f"Console {msg.type}: {msg.text}")
+                print(f"Console {msg_type}: {text}")
 
-        page.on("console", handle_console)
+        # Only keep type/text so ConsoleMessage objects are not retained
+        page.on("console", lambda msg: handle_console(msg.type, msg.text))
 
-    def test_homepage(self, page):
+    async def test_homepage(self, page):
         """Test 1: Homepage Test"""
         print("\n\n🏠 TESTING HOMEPAGE...")
+        screenshot_path = None
         try:
             # Navigate to homepage
-            response = page.goto(self.base_url, wait_until="networkidle", timeout=10000)
+            response = await page.goto(self.base_url, wait_until="domcontentloaded", timeout=10000)
+            await self.wait_for_element(page, 'nav, [data-testid="hero"]')
 
             # Take screenshot
-            screenshot_path = f"{self.screenshot_dir}/test_01_homepage.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = self.paths['homepage']
+            await self._shot(page, screenshot_path, full=True)
 
             # Check response status
             if response.status != 200:
@@ -63,15 +196,21 @@ class PassioTourTester:
                              f"HTTP status: {response.status}", screenshot_path)
                 return
 
-            # Verify navigation menu
-            nav_present = page.locator("nav").count() > 0
-
-            # Check for Sign In and Sign Up buttons
-            sign_in_present = page.get_by_text("Sign In", exact=False).count() > 0
-            sign_up_present = page.get_by_text("Sign Up", exact=False).count() > 0
+            # Verify navigation menu and Sign In/Sign Up buttons in a single round-trip
+            probe = await page.evaluate("""() => {
+                const text = document.body ? document.body.innerText.toLowerCase() : '';
+                return {
+                    nav: document.querySelector('nav') !== null,
+                    signIn: text.includes('sign in'),
+                    signUp: text.includes('sign up')
+                };
+            }""")
+            nav_present = probe['nav']
+            sign_in_present = probe['signIn']
+            sign_up_present = probe['signUp']
 
             # Get page title
-            title = page.title()
+            title = await page.title()
 
             details = f"Title: '{title}', Navigation: {nav_present}, Sign In button: {sign_in_present}, Sign Up button: {sign_up_present}"
 
@@ -84,96 +223,64 @@ class PassioTourTester:
         except Exception as e:
             self.log_test("Homepage Test", "FAILED", f"Error: {str(e)}", screenshot_path)
 
-    def test_login_flow(self, page):
+    async def test_login_flow(self, page):
         """Test 2: Login Flow Test"""
         print("\n\n🔐 TESTING LOGIN FLOW...")
         try:
             # Navigate to login page
-            page.goto(f"{self.base_url}/login", wait_until="networkidle", timeout=10000)
+            await page.goto(f"{self.base_url}/login", wait_until="domcontentloaded", timeout=10000)
+            # The form is in the server HTML, so only fill it once React owns it
+            hydrated = await self.wait_for_hydration(page, 'form')
 
             # Take screenshot of login page
-            screenshot_path = f"{self.screenshot_dir}/test_02_login_page.png"
-            page.screenshot(path=screenshot_path, full_page=True)
-            self.log_test("Login Page Load", "PASSED", "Login page loaded", screenshot_path)
-
-            # Wait a moment for page to stabilize
-            page.wait_for_timeout(1000)
-
-            # Try to find email input (try multiple selectors)
-            email_input = None
-            email_selectors = [
-                'input[type="email"]',
-                'input[name="email"]',
-                'input[placeholder*="email" i]',
-                'input[id*="email" i]'
-            ]
-
-            for selector in email_selectors:
-                if page.locator(selector).count() > 0:
-                    email_input = page.locator(selector).first
-                    break
-
-            # Try to find password input
-            password_input = None
-            password_selectors = [
-                'input[type="password"]',
-                'input[name="password"]',
-                'input[placeholder*="password" i]',
-                'input[id*="password" i]'
-            ]
-
-            for selector in password_selectors:
-                if page.locator(selector).count() > 0:
-                    password_input = page.locator(selector).first
-                    break
-
-            if not email_input or not password_input:
+            screenshot_path = self.paths['login_page']
+            await self._shot(page, screenshot_path)
+            if hydrated:
+                self.log_test("Login Page Load", "PASSED", "Login page loaded", screenshot_path)
+            else:
+                self.log_test("Login Page Load", "WARNING",
+                             "Login form was not hydrated; filling it anyway", screenshot_path)
+
+            # Try to find email and password inputs
+            email_input = page.locator(EMAIL_SELECTOR).first
+            password_input = page.locator(PASSWORD_SELECTOR).first
+
+            if not await email_input.count() or not await password_input.count():
                 self.log_test("Login Form Fill", "FAILED",
                              "Could not find email or password input fields")
                 return
 
             # Fill in credentials
-            email_input.fill("admin@passiotour.com")
-            password_input.fill("Admin@123")
+            await email_input.fill(LOGIN_EMAIL)
+            await password_input.fill(LOGIN_PASSWORD)
 
             # Take screenshot of filled form
-            screenshot_path = f"{self.screenshot_dir}/test_03_login_filled.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = self.paths['login_filled']
+            await self._shot(page, screenshot_path, full=True)
             self.log_test("Login Form Fill", "PASSED", "Filled login credentials", screenshot_path)
 
             # Find and click Sign In button
-            sign_in_button = None
-            button_selectors = [
-                'button:has-text("Sign In")',
-                'button[type="submit"]',
-                'button:has-text("Login")',
-                'input[type="submit"]'
-            ]
-
-            for selector in button_selectors:
-                if page.locator(selector).count() > 0:
-                    sign_in_button = page.locator(selector).first
-                    break
-
-            if not sign_in_button:
+            sign_in_button = page.locator(SIGN_IN_SELECTOR).first
+
+            if not await sign_in_button.count():
                 self.log_test("Login Submit", "FAILED", "Could not find Sign In button")
                 return
 
             # Click sign in and wait for navigation
             current_url = page.url
-            sign_in_button.click()
+            await sign_in_button.click()
 
             # Wait for navigation or timeout
             try:
-                page.wait_for_url(lambda url: url != current_url, timeout=5000)
-            except:
-                pass  # Continue even if no navigation
-
-            page.wait_for_timeout(2000)
+                await page.wait_for_url(lambda url: url != current_url, timeout=5000,
+                                  wait_until="domcontentloaded")
+            except PlaywrightTimeoutError:
+                # Still on the login page; give an error message a chance to render
+                await self.wait_for_element(page, '[role="alert"]', timeout=2000)
 
             # Take screenshot after login attempt
-            screenshot_path = f"{self.screenshot_dir}/test_04_after_login.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = self.paths['after_login']
+            await self._shot(page, screenshot_path)
 
             final_url = page.url
             if "login" not in final_url:
@@ -181,10 +288,10 @@ class PassioTourTester:
                              f"Successfully redirected to: {final_url}", screenshot_path)
             else:
                 # Check for error messages
-                error_visible = page.locator('[role="alert"]').count() > 0 or \
-                               page.get_by_text("error", exact=False).count() > 0
+                error_visible = await page.locator('[role="alert"]').count() > 0 or \
+                               await page.get_by_text("error", exact=False).count() > 0
                 if error_visible:
-                    error_text = page.locator('[role="alert"]').first.text_content() if page.locator('[role="alert"]').count() > 0 else "Unknown error"
+                    error_text = await page.locator('[role="alert"]').first.text_content() if await page.locator('[role="alert"]').count() > 0 else "Unknown error"
                     self.log_test("Login Flow", "FAILED",
                                  f"Login failed: {error_text}", screenshot_path)
                 else:
@@ -194,71 +301,74 @@ class PassioTourTester:
         except Exception as e:
             self.log_test("Login Flow Test", "FAILED", f"Error: {str(e)}")
 
-    def test_dashboard(self, page):
-        """Test 3: Dashboard Test"""
+    async def test_dashboard(self, page):
+        """Test 3: Dashboard Test (status only, runs in a lite context)"""
         print("\n\n📊 TESTING DASHBOARD...")
         try:
             # Navigate to dashboard
-            response = page.goto(f"{self.base_url}/dashboard", wait_until="networkidle", timeout=10000)
-
-            page.wait_for_timeout(1000)
+            response = await page.goto(f"{self.base_url}/dashboard", wait_until="domcontentloaded", timeout=10000)
 
-            # Take screenshot
-            screenshot_path = f"{self.screenshot_dir}/test_05_dashboard.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            # The server-rendered HTML is only the loading skeleton, so wait for
+            # the auth check to show the dashboard or redirect to login
+            try:
+                await page.wait_for_function(_DASHBOARD_SETTLED_JS, timeout=10000)
+                settled = True
+            except PlaywrightTimeoutError:
+                settled = False
 
             current_url = page.url
 
             # Check if redirected to login (auth required)
             if "login" in current_url:
                 self.log_test("Dashboard Test", "INFO",
-                             "Dashboard requires authentication - redirected to login", screenshot_path)
+                             "Dashboard requires authentication - redirected to login")
+            elif not settled:
+                self.log_test("Dashboard Test", "WARNING",
+                             "Dashboard still showing its loading state")
             else:
-                # Check for dashboard content
-                has_content = len(page.content()) > 1000
-                title = page.title()
+                # Check for dashboard content (serialize the DOM only once)
+                content_length = len(await page.content())
+                has_content = content_length > 1000
+                title = await page.title()
                 self.log_test("Dashboard Test", "PASSED",
-                             f"Dashboard loaded. Title: '{title}', Content length: {len(page.content())} chars",
-                             screenshot_path)
+                             f"Dashboard loaded. Title: '{title}', Content length: {content_length} chars")
 
         except Exception as e:
             self.log_test("Dashboard Test", "FAILED", f"Error: {str(e)}")
 
-    def test_tours_page(self, page):
-        """Test 4: Tours Page Test"""
+    async def test_tours_page(self, page):
+        """Test 4: Tours Page Test (status only, runs in a lite context)"""
         print("\n\n🎫 TESTING TOURS PAGE...")
         try:
             # Navigate to tours page
-            response = page.goto(f"{self.base_url}/tours", wait_until="networkidle", timeout=10000)
-
-            page.wait_for_timeout(1000)
-
-            # Take screenshot
-            screenshot_path = f"{self.screenshot_dir}/test_06_tours.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            response = await page.goto(f"{self.base_url}/tours", wait_until="domcontentloaded", timeout=10000)
+            # The header is server-rendered above a skeleton; wait for the fetch to settle
+            settled = await self.wait_for_element(page, TOURS_SETTLED_SELECTOR, timeout=10000)
 
-            # Check response
+            # Check response and look for errors in page
             status = response.status if response else "No response"
-            current_url = page.url
-            title = page.title()
-
-            # Check for errors in page
-            error_visible = page.locator("text=/error|404|not found/i").count() > 0
+            probe = await page.evaluate(_PAGE_PROBE_JS)
+            current_url = probe['url']
+            title = probe['title']
+            error_visible = probe['has_error']
 
             if error_visible:
                 self.log_test("Tours Page Test", "FAILED",
-                             f"Page shows error. Status: {status}", screenshot_path)
+                             f"Page shows error. Status: {status}")
+            elif not settled:
+                self.log_test("Tours Page Test", "WARNING",
+                             f"Tour list still loading. URL: {current_url}")
             elif status == 200 or status == "200":
                 self.log_test("Tours Page Test", "PASSED",
-                             f"Tours page loaded. Title: '{title}', URL: {current_url}", screenshot_path)
+                             f"Tours page loaded. Title: '{title}', URL: {current_url}")
             else:
                 self.log_test("Tours Page Test", "WARNING",
-                             f"Status: {status}, URL: {current_url}", screenshot_path)
+                             f"Status: {status}, URL: {current_url}")
 
         except Exception as e:
             self.log_test("Tours Page Test", "FAILED", f"Error: {str(e)}")
 
-    def test_static_pages(self, page):
+    async def test_static_pages(self, page):
         """Test 5: Static Pages Test"""
         print("\n\n📄 TESTING STATIC PAGES...")
 
@@ -274,24 +384,42 @@ class PassioTourTester:
 
         for path, name in pages_to_test:
             try:
-                response = page.goto(f"{self.base_url}{path}", wait_until="networkidle", timeout=10000)
-                page.wait_for_timeout(500)
-
-                status = response.status if response else "No response"
-                current_url = page.url
-                title = page.title()
-
                 screenshot_path = None
                 if path in pages_to_screenshot:
-                    screenshot_path = f"{self.screenshot_dir}/test_07_static_{name.lower()}.png"
-                    page.screenshot(path=screenshot_path, full_page=True)
+                    response = await page.goto(f"{self.base_url}{path}", wait_until="domcontentloaded", timeout=10000)
+                    await self.wait_for_element(page, 'main, h1')
+
+                    status = response.status if response else "No response"
+                    probe = await page.evaluate(_PAGE_PROBE_JS)
+                    current_url = probe['url']
+                    title = probe['title']
 
-                # Check for 404 or error
-                is_404 = page.locator("text=/404|not found/i").count() > 0
+                    screenshot_path = self.paths[f"static_{name.lower()}"]
+                    await self._shot(page, screenshot_path)
+
+                    # Check for 404 or error, and for a page that rendered no text
+                    is_404 = probe['is_404']
+                    is_empty = probe['body_len'] == 0
+                else:
+                    # Not screenshotted, so fetch over HTTP and skip rendering entirely
+                    response = await page.context.request.get(f"{self.base_url}{path}", timeout=5000)
+                    try:
+                        status = response.status
+                        current_url = response.url
+                        match = _TITLE_RE.search(await response.text())
+                    finally:
+                        # Release the body held by the driver
+                        await response.dispose()
+                    title = html.unescape(match.group(1).strip()) if match else ""
+                    is_404 = status == 404
+                    is_empty = False
 
                 if is_404:
                     self.log_test(f"{name} Page", "WARNING",
                                  f"Page may not exist (404). URL: {current_url}", screenshot_path)
+                elif is_empty:
+                    self.log_test(f"{name} Page", "WARNING",
+                                 f"Page rendered no content. URL: {current_url}", screenshot_path)
                 elif status == 200 or status == "200":
                     self.log_test(f"{name} Page", "PASSED",
                                  f"Page loaded. Title: '{title}'", screenshot_path)
@@ -302,23 +430,22 @@ class PassioTourTester:
             except Exception as e:
                 self.log_test(f"{name} Page", "FAILED", f"Error: {str(e)}")
 
-    def test_register_page(self, page):
+    async def test_register_page(self, page):
         """Test 6: Register Page Test"""
         print("\n\n📝 TESTING REGISTER PAGE...")
         try:
             # Navigate to register page
-            response = page.goto(f"{self.base_url}/register", wait_until="networkidle", timeout=10000)
-
-            page.wait_for_timeout(1000)
+            response = await page.goto(f"{self.base_url}/register", wait_until="domcontentloaded", timeout=10000)
+            await self.wait_for_element(page, 'form')
 
             # Take screenshot
-            screenshot_path = f"{self.screenshot_dir}/test_08_register.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = self.paths['register']
+            await self._shot(page, screenshot_path)
 
             # Check for form presence
-            form_present = page.locator("form").count() > 0
-            input_fields = page.locator("input").count()
-            title = page.title()
+            form_present = await page.locator("form").count() > 0
+            input_fields = await page.locator("input").count()
+            title = await page.title()
 
             details = f"Title: '{title}', Form present: {form_present}, Input fields: {input_fields}"
 
@@ -333,14 +460,17 @@ class PassioTourTester:
 
     def generate_report(self):
         """Generate final test report"""
+        test_results = self.test_results
+
         print("\n\n" + "="*80)
         print(" PASSIO TOUR APPLICATION - COMPREHENSIVE TEST REPORT")
         print("="*80)
 
-        total_tests = len(self.test_results)
-        passed = len([t for t in self.test_results if t['status'] == 'PASSED'])
-        failed = len([t for t in self.test_results if t['status'] == 'FAILED'])
-        warnings = len([t for t in self.test_results if t['status'] in ['WARNING', 'INFO']])
+        total_tests = len(test_results)
+        counts = collections.Counter(t['status'] for t in test_results)
+        passed = counts['PASSED']
+        failed = counts['FAILED']
+        warnings = counts['WARNING'] + counts['INFO']
 
         print(f"\n📊 SUMMARY:")
         print(f"   Total Tests: {total_tests}")
@@ -349,10 +479,12 @@ class PassioTourTester:
         print(f"   ⚠️  Warnings/Info: {warnings}")
         print(f"   📸 Screenshots: {len(self.screenshots_taken)}")
         print(f"   🐛 Console Errors: {len(self.console_errors)}")
+        if self._console_dropped:
+            print(f"   🗑️  Console Errors Dropped: {self._console_dropped}")
 
         print(f"\n📝 DETAILED RESULTS:")
-        for i, result in enumerate(self.test_results, 1):
-            status_icon = "✅" if result['status'] == 'PASSED' else "❌" if result['status'] == 'FAILED' else "⚠️"
+        for i, result in enumerate(test_results, 1):
+            status_icon = STATUS_ICONS.get(result['status'], "⚠️")
             print(f"\n{i}. {status_icon} {result['test_name']}")
             print(f"   Status: {result['status']}")
             print(f"   Details: {result['details']}")
@@ -361,13 +493,13 @@ class PassioTourTester:
 
         if self.console_errors:
             print(f"\n🐛 CONSOLE ERRORS/WARNINGS:")
-            for i, error in enumerate(self.console_errors[:10], 1):  # Show first 10
+            for i, error in enumerate(itertools.islice(self.console_errors, 10), 1):  # Show first 10
                 print(f"   {i}. {error}")
             if len(self.console_errors) > 10:
                 print(f"   ... and {len(self.console_errors) - 10} more")
 
         print(f"\n📸 SCREENSHOTS TAKEN:")
-        for screenshot in self.screenshots_taken:
+        for screenshot in sorted(self.screenshots_taken):
             print(f"   - {screenshot}")
 
         # Overall status
@@ -381,54 +513,128 @@ class PassioTourTester:
         print("\n" + "="*80)
 
         # Save JSON report
-        report_path = f"{self.screenshot_dir}/test_report.json"
-        with open(report_path, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'summary': {
-                    'total_tests': total_tests,
-                    'passed': passed,
-                    'failed': failed,
-                    'warnings': warnings,
-                    'screenshots': len(self.screenshots_taken),
-                    'console_errors': len(self.console_errors)
-                },
-                'test_results': self.test_results,
-                'console_errors': self.console_errors,
-                'screenshots': self.screenshots_taken
-            }, f, indent=2)
+        report_path = self.report_path
+        payload = {
+            'timestamp': datetime.now().isoformat(),
+            'summary': {
+                'total_tests': total_tests,
+                'passed': passed,
+                'failed': failed,
+                'warnings': warnings,
+                'screenshots': len(self.screenshots_taken),
+                'console_errors': len(self.console_errors),
+                'console_errors_dropped': self._console_dropped
+            },
+            'test_results': test_results,
+            'console_errors': list(self.console_errors),
+            'screenshots': sorted(self.screenshots_taken)
+        }
+        with open(report_path, 'wb', buffering=1 << 16) as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"\n📄 Detailed JSON report saved to: {report_path}")
 
-    def run_all_tests(self):
-        """Run all tests"""
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-            )
-            page = context.new_page()
-
-            # Setup console listener
-            self.setup_console_listener(page)
+    async def new_context(self, browser, storage_state=None):
+        """Create a fresh context on the shared browser"""
+        return await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
+            # Service worker installs keep the page busy and are never under test
+            service_workers='block',
+            bypass_csp=True,
+            java_script_enabled=True,
+            ignore_https_errors=True,
+            storage_state=storage_state
+        )
+
+    async def authenticate(self, browser):
+        """Log in once and return the session's storage state, or None if login fails"""
+        context = await self.new_context(browser)
+        try:
+            page = await context.new_page()
+            await page.goto(f"{self.base_url}/login", wait_until="domcontentloaded", timeout=10000)
+            if not await self.wait_for_hydration(page, 'form'):
+                print("Could not log in for authenticated tests: login form was not hydrated")
+                return None
+            await page.locator(EMAIL_SELECTOR).first.fill(LOGIN_EMAIL)
+            await page.locator(PASSWORD_SELECTOR).first.fill(LOGIN_PASSWORD)
+            await page.locator(SIGN_IN_SELECTOR).first.click()
+            await page.wait_for_url(lambda url: "login" not in url, timeout=5000,
+                                    wait_until="domcontentloaded")
+            return await context.storage_state()
+        except Exception as e:
+            print(f"Could not log in for authenticated tests: {str(e)}")
+            return None
+        finally:
+            await context.close()
+
+    async def run_test(self, browser, slots, test_method, test_name, lite=False, auth_task=None):
+        """Run a single test in its own context on the shared browser
+
+        Lite contexts skip images, fonts and media for status-only tests, which take
+        no screenshots since those would be missing their images.
+        Tests given auth_task start from the logged-in session it resolves to.
+        """
+        try:
+            storage_state = await auth_task if auth_task is not None else None
+            async with slots:
+                # Fresh context per test so cookies/storage never bleed across tests
+                context = await self.new_context(browser, storage_state=storage_state)
+                if lite:
+                    await context.route(_HEAVY_RESOURCE_RE, _abort_route)
+                try:
+                    page = await context.new_page()
+                    self.setup_console_listener(page)
+                    await test_method(page)
+                finally:
+                    await context.close()
+        except Exception as e:
+            self.log_test(test_name, "FAILED", f"Error: {str(e)}")
+
+    async def run_tests(self):
+        """Run all tests concurrently, one context each on a single browser"""
+        # (method, name, lite, needs_auth)
+        tests = [
+            (self.test_homepage, "Homepage Test", False, False),
+            (self.test_login_flow, "Login Flow Test", False, False),
+            (self.test_dashboard, "Dashboard Test", True, True),
+            (self.test_tours_page, "Tours Page Test", True, False),
+            (self.test_static_pages, "Static Pages Test", False, False),
+            (self.test_register_page, "Register Page Test", False, False),
+        ]
 
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            auth_task = asyncio.create_task(self.authenticate(browser))
             try:
-                # Run all tests
-                self.test_homepage(page)
-                self.test_login_flow(page)
-                self.test_dashboard(page)
-                self.test_tours_page(page)
-                self.test_static_pages(page)
-                self.test_register_page(page)
-
+                # Caps how many contexts are open at once
+                slots = asyncio.Semaphore(min(len(tests), os.cpu_count() or 1))
+                await asyncio.gather(*(
+                    self.run_test(browser, slots, method, name, lite,
+                                  auth_task if needs_auth else None)
+                    for method, name, lite, needs_auth in tests
+                ))
             finally:
-                # Cleanup
-                context.close()
-                browser.close()
+                auth_task.cancel()
+                await browser.close()
 
-            # Generate report
-            self.generate_report()
+    def run_all_tests(self):
+        """Run all tests concurrently"""
+        self.test_results = []
+        self._results_log = open(self.results_log_path, 'wb')
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._io_futures = []
+        try:
+            asyncio.run(self.run_tests())
+        finally:
+            # Flush pending screenshots and streamed results even if the run is aborted
+            self.check_screenshot_writes()
+            self._io_pool.shutdown()
+            self._io_pool = None
+            self._results_log.close()
+            self._results_log = None
+
+        # Generate report
+        self.generate_report()
 
 if __name__ == "__main__":
     print("🚀 Starting Passio Tour Comprehensive Test Suite...")